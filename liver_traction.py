@@ -1,7 +1,400 @@
+import hashlib
+import heapq
+import math
 import os
+from collections import deque
+
+import numpy as np
 import Sofa
 
 
+def _quat_multiply(a, b):
+    ax, ay, az, aw = a
+    bx, by, bz, bw = b
+    return [
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+        aw * bw - ax * bx - ay * by - az * bz,
+    ]
+
+
+def _quat_from_axis_angle(axis, angle):
+    s = math.sin(0.5 * angle)
+    return [axis[0] * s, axis[1] * s, axis[2] * s, math.cos(0.5 * angle)]
+
+
+def _quat_to_matrix(q):
+    x, y, z, w = q
+    n = math.sqrt(x * x + y * y + z * z + w * w)
+    if n == 0.0:
+        return np.eye(3)
+    x, y, z, w = x / n, y / n, z / n, w / n
+    return np.array(
+        [
+            [1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - z * w), 2.0 * (x * z + y * w)],
+            [2.0 * (x * y + z * w), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - x * w)],
+            [2.0 * (x * z - y * w), 2.0 * (y * z + x * w), 1.0 - 2.0 * (x * x + y * y)],
+        ]
+    )
+
+
+def _oriented(vertices, triangles):
+    # Flip a closed mesh so its faces point outwards (positive signed volume).
+    v = np.asarray(vertices, dtype=float)
+    t = np.asarray(triangles, dtype=int)
+    volume = np.einsum("ij,ij->i", v[t[:, 0]], np.cross(v[t[:, 1]], v[t[:, 2]])).sum()
+    if volume < 0.0:
+        t = t[:, [0, 2, 1]]
+    return v.tolist(), t.tolist()
+
+
+def _merge_meshes(*meshes):
+    vertices = []
+    triangles = []
+    for verts, tris in meshes:
+        base = len(vertices)
+        vertices.extend(verts)
+        triangles.extend([[a + base, b + base, c + base] for a, b, c in tris])
+    return vertices, triangles
+
+
+def box_mesh(half, offset=(0.0, 0.0, 0.0)):
+    hx, hy, hz = half
+    ox, oy, oz = offset
+    vertices = [
+        [ox - hx, oy - hy, oz - hz],
+        [ox + hx, oy - hy, oz - hz],
+        [ox + hx, oy + hy, oz - hz],
+        [ox - hx, oy + hy, oz - hz],
+        [ox - hx, oy - hy, oz + hz],
+        [ox + hx, oy - hy, oz + hz],
+        [ox + hx, oy + hy, oz + hz],
+        [ox - hx, oy + hy, oz + hz],
+    ]
+    triangles = [
+        [0, 2, 1],
+        [0, 3, 2],
+        [4, 5, 6],
+        [4, 6, 7],
+        [0, 1, 5],
+        [0, 5, 4],
+        [1, 2, 6],
+        [1, 6, 5],
+        [2, 3, 7],
+        [2, 7, 6],
+        [3, 0, 4],
+        [3, 4, 7],
+    ]
+    return vertices, triangles
+
+
+def extruded_profile_mesh(profile, thickness):
+    # Convex (y, z) outline extruded along local X.
+    h = 0.5 * thickness
+    n = len(profile)
+    vertices = [[-h, y, z] for y, z in profile] + [[h, y, z] for y, z in profile]
+    triangles = []
+    for i in range(1, n - 1):
+        triangles.append([0, i + 1, i])
+        triangles.append([n, n + i, n + i + 1])
+    for i in range(n):
+        j = (i + 1) % n
+        triangles.append([i, j, n + j])
+        triangles.append([i, n + j, n + i])
+    return _oriented(vertices, triangles)
+
+
+def build_tool_mesh(shape, rod_half):
+    if shape == "rod":
+        return box_mesh(rod_half)
+    if shape == "scalpel":
+        handle = box_mesh([0.1, 0.18, 1.2], offset=(0.0, 0.0, -1.3))
+        blade = extruded_profile_mesh(
+            [(-0.18, -0.1), (0.18, -0.1), (0.18, 1.2), (0.0, 2.5), (-0.18, 1.6)],
+            thickness=0.05,
+        )
+        return _merge_meshes(handle, blade)
+    if shape == "hook":
+        shaft = box_mesh([0.08, 0.08, 2.0], offset=(0.0, 0.0, -0.5))
+        bend = box_mesh([0.08, 0.35, 0.08], offset=(0.0, -0.27, 1.5))
+        barb = box_mesh([0.08, 0.08, 0.3], offset=(0.0, -0.54, 1.28))
+        return _merge_meshes(shaft, bend, barb)
+    raise ValueError(f"Unknown tool shape: {shape}")
+
+
+def _subdivide_tets(tets):
+    # Split each (n, 4, 3) tet into eight children through its edge midpoints.
+    v0, v1, v2, v3 = tets[:, 0], tets[:, 1], tets[:, 2], tets[:, 3]
+    m01, m02, m03 = 0.5 * (v0 + v1), 0.5 * (v0 + v2), 0.5 * (v0 + v3)
+    m12, m13, m23 = 0.5 * (v1 + v2), 0.5 * (v1 + v3), 0.5 * (v2 + v3)
+    children = [
+        (v0, m01, m02, m03),
+        (v1, m01, m12, m13),
+        (v2, m02, m12, m23),
+        (v3, m03, m13, m23),
+        (m01, m02, m03, m13),
+        (m01, m02, m12, m13),
+        (m02, m03, m13, m23),
+        (m02, m12, m13, m23),
+    ]
+    return np.stack([np.stack(c, axis=1) for c in children], axis=1).reshape(-1, 4, 3)
+
+
+def _dot(u, v):
+    return np.einsum("...i,...i->...", u, v)
+
+
+def _point_triangle_distance(p, tri):
+    # Distance from points (..., 3) to triangles (..., 3, 3), broadcast together.
+    a, b, c = tri[..., 0, :], tri[..., 1, :], tri[..., 2, :]
+    pa = p - a
+    ab = b - a
+    ac = c - a
+    normal = np.cross(ab, ac)
+    length = np.linalg.norm(normal, axis=-1)
+    unit = normal / np.where(length > 0.0, length, 1.0)[..., None]
+    # Barycentric test on the projected point.
+    d00 = _dot(ab, ab)
+    d01 = _dot(ab, ac)
+    d11 = _dot(ac, ac)
+    denom = d00 * d11 - d01 * d01
+    d20 = _dot(pa, ab)
+    d21 = _dot(pa, ac)
+    safe = np.where(denom != 0.0, denom, 1.0)
+    v = (d11 * d20 - d01 * d21) / safe
+    w = (d00 * d21 - d01 * d20) / safe
+    inside = (v >= 0.0) & (w >= 0.0) & (v + w <= 1.0) & (denom != 0.0)
+    plane = np.abs(_dot(pa, unit))
+    edge = np.full(plane.shape, np.inf)
+    for s, e in ((a, b), (b, c), (c, a)):
+        se = e - s
+        ps = p - s
+        seg = _dot(se, se)
+        t = np.clip(_dot(ps, se) / np.where(seg > 0.0, seg, 1.0), 0.0, 1.0)
+        edge = np.minimum(edge, np.linalg.norm(ps - t[..., None] * se, axis=-1))
+    return np.where(inside, plane, edge)
+
+
+def _segment_triangle_params(p0, p1, tri):
+    # Moller-Trumbore for segments (..., 3) against triangles (..., 3, 3); segment parameter, inf on a miss.
+    d = p1 - p0
+    e1 = tri[..., 1, :] - tri[..., 0, :]
+    e2 = tri[..., 2, :] - tri[..., 0, :]
+    h = np.cross(d, e2)
+    a = _dot(h, e1)
+    ok = np.abs(a) > 1e-12
+    f = 1.0 / np.where(ok, a, 1.0)
+    s = p0 - tri[..., 0, :]
+    u = f * _dot(s, h)
+    q = np.cross(s, e1)
+    v = f * _dot(d, q)
+    t = f * _dot(e2, q)
+    hit = ok & (u >= 0.0) & (v >= 0.0) & (u + v <= 1.0) & (t >= 0.0) & (t <= 1.0)
+    return np.where(hit, t, np.inf)
+
+
+def _segment_distances(p0, p1, q0, q1):
+    # Closest distance between segments p and q (..., 3), broadcast together.
+    d1 = p1 - p0
+    d2 = q1 - q0
+    r = p0 - q0
+    a = np.maximum(_dot(d1, d1), 1e-24)
+    e = np.maximum(_dot(d2, d2), 1e-24)
+    b = _dot(d1, d2)
+    c = _dot(d1, r)
+    f = _dot(d2, r)
+    denom = a * e - b * b
+    s = np.where(denom > 1e-24, np.clip((b * f - c * e) / np.where(denom > 1e-24, denom, 1.0), 0.0, 1.0), 0.0)
+    t = (b * s + f) / e
+    s = np.where(t < 0.0, np.clip(-c / a, 0.0, 1.0), np.where(t > 1.0, np.clip((b - c) / a, 0.0, 1.0), s))
+    t = np.clip(t, 0.0, 1.0)
+    return np.linalg.norm(r + s[..., None] * d1 - t[..., None] * d2, axis=-1)
+
+
+_TET_EDGES = ([0, 0, 0, 1, 1, 2], [1, 2, 3, 2, 3, 3])
+_TET_FACES = [[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]]
+
+
+class ToolSDF:
+    """Signed distance to a closed triangle mesh, sampled on a grid in tool-local space.
+
+    The grid spacing resolves the tool's thinnest feature with ``feature_cells`` cells.
+    The grid is computed once (and cached under ``cache_dir`` when given); lookups
+    are trilinear and fully vectorized. Points outside the grid report their distance
+    to the mesh bounding box, a lower bound of the true distance. ``tet_distance``
+    gives the exact distance from tetrahedra to the mesh itself.
+    """
+
+    def __init__(
+        self,
+        vertices,
+        triangles,
+        feature_cells=2,
+        padding=0.5,
+        max_points=2_000_000,
+        cache_dir=None,
+        name="tool",
+    ):
+        self.vertices = np.asarray(vertices, dtype=float)
+        self.triangles = np.asarray(triangles, dtype=int)
+        edges = np.sort(self.triangles[:, [[0, 1], [1, 2], [2, 0]]].reshape(-1, 2), axis=1)
+        self.edges = np.unique(edges, axis=0)
+        self.padding = float(padding)
+        lo = self.vertices.min(axis=0) - self.padding
+        hi = self.vertices.max(axis=0) + self.padding
+        self.thickness = self._thinnest_feature()
+        self.spacing = self.thickness / feature_cells
+        points = np.prod((hi - lo) / self.spacing + 1.0)
+        if points > max_points:
+            self.spacing *= (points / max_points) ** (1.0 / 3.0)
+            print(f"[WARNING] Tool SDF grid capped at {max_points} points, spacing {self.spacing:.4f}")
+        self.shape = tuple(int(math.ceil(e / self.spacing)) + 1 for e in (hi - lo))
+        self.origin = lo
+        self.upper = lo + self.spacing * (np.array(self.shape) - 1)
+        self.values = self._load_or_build(cache_dir, name)
+
+    def _thinnest_feature(self):
+        # Shortest inward ray from a face centroid to the opposite side of the mesh.
+        tri = self.vertices[self.triangles]
+        normal = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        normal /= np.maximum(np.linalg.norm(normal, axis=1), 1e-24)[:, None]
+        reach = 2.0 * float(np.ptp(self.vertices, axis=0).max())
+        start = tri.mean(axis=1)
+        t = _segment_triangle_params(start[:, None, :], (start - reach * normal)[:, None, :], tri[None])
+        np.fill_diagonal(t, np.inf)
+        t[t <= 1e-9] = np.inf
+        thinnest = float(t.min()) * reach
+        return thinnest if math.isfinite(thinnest) else 0.5 * reach
+
+    def _cache_key(self):
+        h = hashlib.sha1()
+        h.update(self.vertices.tobytes())
+        h.update(self.triangles.tobytes())
+        h.update(f"{self.spacing}:{self.padding}".encode())
+        return h.hexdigest()[:16]
+
+    def _load_or_build(self, cache_dir, name):
+        path = None
+        if cache_dir:
+            path = os.path.join(cache_dir, f"{name}_{self._cache_key()}.npz")
+            if os.path.isfile(path):
+                try:
+                    with np.load(path) as data:
+                        values = data["values"]
+                    if values.shape == self.shape:
+                        return values
+                except (OSError, KeyError, ValueError):
+                    pass
+        values = self._build()
+        if path is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                np.savez_compressed(path, values=values)
+            except OSError as exc:
+                print(f"[WARNING] Could not cache tool SDF: {exc}")
+        print(f"[INFO] Built {name} SDF grid {self.shape}")
+        return values
+
+    def _build(self, chunk=2_000_000):
+        axes = [self.origin[i] + self.spacing * np.arange(self.shape[i]) for i in range(3)]
+        gx, gy, gz = np.meshgrid(*axes, indexing="ij")
+        points = np.stack([gx.ravel(), gy.ravel(), gz.ravel()], axis=1)
+        tri = self.vertices[self.triangles]
+        step = max(1, chunk // max(1, len(tri)))
+        values = np.empty(len(points))
+        for start in range(0, len(points), step):
+            p = points[start : start + step]
+            dist = self._unsigned_distance(p, tri)
+            inside = np.abs(self._winding_number(p, tri)) > 0.5
+            values[start : start + step] = np.where(inside, -dist, dist)
+        return values.reshape(self.shape)
+
+    @staticmethod
+    def _unsigned_distance(p, tri):
+        return _point_triangle_distance(p[:, None, :], tri[None, :, :, :]).min(axis=1)
+
+    @staticmethod
+    def _winding_number(p, tri):
+        a = tri[None, :, 0, :] - p[:, None, :]
+        b = tri[None, :, 1, :] - p[:, None, :]
+        c = tri[None, :, 2, :] - p[:, None, :]
+        la = np.linalg.norm(a, axis=2)
+        lb = np.linalg.norm(b, axis=2)
+        lc = np.linalg.norm(c, axis=2)
+        num = np.einsum("pti,pti->pt", a, np.cross(b, c))
+        den = (
+            la * lb * lc
+            + np.einsum("pti,pti->pt", a, b) * lc
+            + np.einsum("pti,pti->pt", b, c) * la
+            + np.einsum("pti,pti->pt", c, a) * lb
+        )
+        return np.arctan2(num, den).sum(axis=1) / (2.0 * math.pi)
+
+    def query(self, local_points):
+        p = np.asarray(local_points, dtype=float).reshape(-1, 3)
+        g = (p - self.origin) / self.spacing
+        dims = np.array(self.shape)
+        valid = np.all((g >= 0.0) & (g <= dims - 1), axis=1)
+        out = np.empty(len(p))
+        if not valid.all():
+            outside = p[~valid]
+            gap = np.maximum(np.maximum(self.vertices.min(axis=0) - outside, outside - self.vertices.max(axis=0)), 0.0)
+            out[~valid] = np.linalg.norm(gap, axis=1)
+        if not valid.any():
+            return out
+        g = g[valid]
+        i0 = np.minimum(np.floor(g).astype(int), dims - 2)
+        f = g - i0
+        x0, y0, z0 = i0[:, 0], i0[:, 1], i0[:, 2]
+        fx, fy, fz = f[:, 0], f[:, 1], f[:, 2]
+        v = self.values
+        c00 = v[x0, y0, z0] * (1 - fx) + v[x0 + 1, y0, z0] * fx
+        c10 = v[x0, y0 + 1, z0] * (1 - fx) + v[x0 + 1, y0 + 1, z0] * fx
+        c01 = v[x0, y0, z0 + 1] * (1 - fx) + v[x0 + 1, y0, z0 + 1] * fx
+        c11 = v[x0, y0 + 1, z0 + 1] * (1 - fx) + v[x0 + 1, y0 + 1, z0 + 1] * fx
+        c0 = c00 * (1 - fy) + c10 * fy
+        c1 = c01 * (1 - fy) + c11 * fy
+        out[valid] = c0 * (1 - fz) + c1 * fz
+        return out
+
+    def tet_distance(self, tets):
+        # Exact distance from each (n, 4, 3) tet to the tool: zero when they overlap, otherwise the
+        # closest vertex-face or edge-edge pair.
+        n = len(tets)
+        verts = self.vertices
+        tri = verts[self.triangles]
+        e0 = verts[self.edges[:, 0]]
+        e1 = verts[self.edges[:, 1]]
+        faces = tets[:, _TET_FACES]
+        t0 = tets[:, _TET_EDGES[0]]
+        t1 = tets[:, _TET_EDGES[1]]
+        overlap = (np.abs(self._winding_number(tets.reshape(-1, 3), tri)).reshape(n, 4) > 0.5).any(axis=1)
+        basis = tets[:, 1:] - tets[:, :1]
+        regular = np.abs(np.linalg.det(basis)) > 1e-18
+        inv = np.linalg.inv(np.where(regular[:, None, None], basis, np.eye(3)))
+        bary = np.einsum("nvi,nij->nvj", verts[None] - tets[:, :1], inv)
+        contained = np.all(bary >= 0.0, axis=2) & (bary.sum(axis=2) <= 1.0)
+        overlap |= regular & contained.any(axis=1)
+        crossing = _segment_triangle_params(t0[:, :, None], t1[:, :, None], tri[None, None])
+        overlap |= np.isfinite(crossing).any(axis=(1, 2))
+        crossing = _segment_triangle_params(e0[None, :, None], e1[None, :, None], faces[:, None])
+        overlap |= np.isfinite(crossing).any(axis=(1, 2))
+        dist = np.minimum(
+            _point_triangle_distance(tets[:, :, None], tri[None, None]).min(axis=(1, 2)),
+            _point_triangle_distance(verts[None, :, None], faces[:, None]).min(axis=(1, 2)),
+        )
+        edge = _segment_distances(t0[:, :, None], t1[:, :, None], e0[None, None], e1[None, None])
+        dist = np.minimum(dist, edge.min(axis=(1, 2)))
+        return np.where(overlap, 0.0, dist)
+
+    def world_bounds(self, center, rotation):
+        lo, hi = self.origin, self.upper
+        corners = np.array([[x, y, z] for x in (lo[0], hi[0]) for y in (lo[1], hi[1]) for z in (lo[2], hi[2])])
+        world = corners @ rotation.T + np.asarray(center, dtype=float)
+        return world.min(axis=0), world.max(axis=0)
+
+
 class RodCutController(Sofa.Core.Controller):
     def __init__(
         self,
@@ -11,10 +404,21 @@ class RodCutController(Sofa.Core.Controller):
         topo_mod,
         topo_proc,
         center,
-        half,
+        tool,
         speed=8.0,
         dt=0.02,
         rigid=False,
+        orientation=(0.0, 0.0, 0.0, 1.0),
+        margin=0.0,
+        refine_depth=2,
+        check_cuts=False,
+        rot_speed=1.5,
+        fixed_box=None,
+        detached_policy="remove",
+        frozen_constraint=None,
+        uv_projector=None,
+        compact_ratio=0.2,
+        quality_monitor=None,
     ):
         super().__init__()
         self.listening = True
@@ -24,8 +428,31 @@ class RodCutController(Sofa.Core.Controller):
         self.topo_mod = topo_mod
         self.topo_proc = topo_proc
         self.center = list(center)
-        self.half = list(half)
+        self.tool = tool
+        self.orientation = list(orientation)
+        self.margin = margin
+        self.refine_depth = refine_depth
+        self.check_cuts = check_cuts
+        self.fixed_box = fixed_box
+        if detached_policy == "freeze" and frozen_constraint is None:
+            print("[WARNING] Detached policy 'freeze' needs a frozen FixedConstraint, falling back to 'remove'")
+            detached_policy = "remove"
+        self.detached_policy = detached_policy
+        self.frozen_constraint = frozen_constraint
+        self._frozen = set()
+        self.uv_projector = uv_projector
+        self.quality_monitor = quality_monitor
+        self.compact_ratio = compact_ratio
+        self.compact_requested = False
+        self.last_compaction = None
+        self._pending_compaction = None
+        self._last_tet_count = None
+        # Older TopologicalChangeProcessor builds only take edge/triangle/quad/tetra/hexa removals.
+        self._can_compact = self.topo_proc is not None and self._has_data(self.topo_proc, "pointsToRemove")
+        if self.topo_proc is not None and not self._can_compact:
+            print("[WARNING] TopologicalChangeProcessor has no pointsToRemove input: DOF compaction disabled")
         self.speed = speed
+        self.rot_speed = rot_speed
         self.dt = dt
         self.rigid = rigid
         self.keys_down = set()
@@ -61,9 +488,18 @@ class RodCutController(Sofa.Core.Controller):
             "pageup": (0.0, 1.0, 0.0),
             "pagedown": (0.0, -1.0, 0.0),
         }
+        self._rotate_map = {
+            "7": ((0.0, 1.0, 0.0), 1.0),
+            "1": ((0.0, 1.0, 0.0), -1.0),
+            "/": ((1.0, 0.0, 0.0), 1.0),
+            "*": ((1.0, 0.0, 0.0), -1.0),
+            "-": ((0.0, 0.0, 1.0), 1.0),
+            "+": ((0.0, 0.0, 1.0), -1.0),
+        }
         self._update_rod_positions()
         print("[INFO] Rod control: keypad 8/2=Z+,Z- 4/6=X-,X+ 9/3=Y+,Y-")
-        print("[INFO] P=toggle cut, R=reset rod")
+        print("[INFO] Rod rotate: keypad 7/1=yaw /,*=pitch -,+=roll")
+        print("[INFO] P=toggle cut, R=reset rod, C=compact DOFs")
 
     def onKeypressedEvent(self, event):
         self._dispatch_key_event(event, pressed=True)
@@ -84,8 +520,16 @@ class RodCutController(Sofa.Core.Controller):
         dx, dy, dz = self._movement_direction()
         if dx or dy or dz:
             self._apply_delta(dx * self.speed * self.dt, dy * self.speed * self.dt, dz * self.speed * self.dt)
+        for key in list(self.keys_down):
+            if key in self._rotate_map:
+                self._rotate_once(key)
+        if self._pending_compaction is not None:
+            self._finish_compaction()
+        cut = False
         if self.cut_enabled:
-            self._cut_at_rod()
+            cut = self._cut_at_rod()
+        if not cut and self._pending_compaction is None:
+            self._maybe_compact()
 
     def _event_key(self, event):
         if isinstance(event, dict):
@@ -149,6 +593,12 @@ class RodCutController(Sofa.Core.Controller):
     def _is_move_key(self, key):
         return key in self._move_map
 
+    def _rotate_once(self, key):
+        axis, sign = self._rotate_map[key]
+        delta = _quat_from_axis_angle(axis, sign * self.rot_speed * self.dt)
+        self.orientation = _quat_multiply(delta, self.orientation)
+        self._update_rod_positions()
+
     def _nudge_once(self, key):
         step = self.speed * self.dt
         dx, dy, dz = 0.0, 0.0, 0.0
@@ -206,8 +656,13 @@ class RodCutController(Sofa.Core.Controller):
             print(f"[INFO] Cut mode: {state}")
             self.keys_down.add(key)
             return True
+        if key == "c":
+            self.compact_requested = True
+            self.keys_down.add(key)
+            return True
         if key == "r":
             self.center = [0.0, 0.0, 0.0]
+            self.orientation = [0.0, 0.0, 0.0, 1.0]
             self._update_rod_positions()
             self.keys_down.add(key)
             return True
@@ -215,6 +670,10 @@ class RodCutController(Sofa.Core.Controller):
             self.keys_down.add(key)
             self._nudge_once(key)
             return True
+        if key in self._rotate_map:
+            self.keys_down.add(key)
+            self._rotate_once(key)
+            return True
         return False
 
     def _handle_key_release(self, key):
@@ -231,24 +690,14 @@ class RodCutController(Sofa.Core.Controller):
             return
         if self.rigid:
             cx, cy, cz = self.center
-            pose = [cx, cy, cz, 0.0, 0.0, 0.0, 1.0]
+            pose = [cx, cy, cz] + list(self.orientation)
             if hasattr(data, "value"):
                 data.value = [pose]
             else:
                 self.rod_mo.position = [pose]
             return
-        hx, hy, hz = self.half
-        cx, cy, cz = self.center
-        positions = [
-            [cx - hx, cy - hy, cz - hz],
-            [cx + hx, cy - hy, cz - hz],
-            [cx + hx, cy + hy, cz - hz],
-            [cx - hx, cy + hy, cz - hz],
-            [cx - hx, cy - hy, cz + hz],
-            [cx + hx, cy - hy, cz + hz],
-            [cx + hx, cy + hy, cz + hz],
-            [cx - hx, cy + hy, cz + hz],
-        ]
+        rot = _quat_to_matrix(self.orientation)
+        positions = (self.tool.vertices @ rot.T + np.asarray(self.center, dtype=float)).tolist()
         if hasattr(data, "value"):
             data.value = positions
         else:
@@ -273,41 +722,40 @@ class RodCutController(Sofa.Core.Controller):
             return
         if len(positions) == 0 or len(tetras) == 0:
             return
-        hx, hy, hz = self.half
-        cx, cy, cz = self.center
-        rod_min_x = cx - hx
-        rod_max_x = cx + hx
-        rod_min_y = cy - hy
-        rod_max_y = cy + hy
-        rod_min_z = cz - hz
-        rod_max_z = cz + hz
+        positions = np.asarray(positions, dtype=float)
+        tetras = np.asarray(tetras, dtype=int)
+        rot = _quat_to_matrix(self.orientation)
+        center = np.asarray(self.center, dtype=float)
+        tool_min, tool_max = self.tool.world_bounds(center, rot)
+        tet_pts = positions[tetras]
+        candidates = np.nonzero(
+            np.all(tet_pts.max(axis=1) >= tool_min - self.margin, axis=1)
+            & np.all(tet_pts.min(axis=1) <= tool_max + self.margin, axis=1)
+        )[0]
         to_remove = []
-        for i, tet in enumerate(tetras):
-            p0 = positions[tet[0]]
-            p1 = positions[tet[1]]
-            p2 = positions[tet[2]]
-            p3 = positions[tet[3]]
-            min_x = min(p0[0], p1[0], p2[0], p3[0])
-            max_x = max(p0[0], p1[0], p2[0], p3[0])
-            if max_x < rod_min_x or min_x > rod_max_x:
-                continue
-            min_y = min(p0[1], p1[1], p2[1], p3[1])
-            max_y = max(p0[1], p1[1], p2[1], p3[1])
-            if max_y < rod_min_y or min_y > rod_max_y:
-                continue
-            min_z = min(p0[2], p1[2], p2[2], p3[2])
-            max_z = max(p0[2], p1[2], p2[2], p3[2])
-            if max_z < rod_min_z or min_z > rod_max_z:
-                continue
-            if (
-                max_x >= rod_min_x
-                and min_x <= rod_max_x
-                and max_y >= rod_min_y
-                and min_y <= rod_max_y
-                and max_z >= rod_min_z
-                and min_z <= rod_max_z
-            ):
-                to_remove.append(i)
+        if candidates.size:
+            local = (tet_pts[candidates].reshape(-1, 3) - center) @ rot
+            local = local.reshape(-1, 4, 3)
+            hit = self._tool_hits(local)
+            to_remove = candidates[hit].tolist()
+            if self.check_cuts and hit.any():
+                far = self.tool.tet_distance(local[hit]) > self.margin + self.tool.spacing
+                if far.any():
+                    print(f"[WARNING] Cut check: {int(far.sum())} removed tetras lie over a cell from the tool")
+        if to_remove and self.quality_monitor is not None:
+            degenerate = self.quality_monitor.check(positions, tetras, to_remove)
+            if self.quality_monitor.policy == "remove":
+                to_remove.extend(degenerate)
+        if to_remove and self.detached_policy in ("remove", "freeze"):
+            detached = self._detached_tets(positions, tetras, to_remove)
+            if detached:
+                if self.detached_policy == "remove":
+                    to_remove.extend(detached)
+                    if self.quality_monitor is not None:
+                        self.quality_monitor.discard(tetras, detached)
+                else:
+                    self._freeze_points(np.unique(tetras[detached]).tolist())
+                print(f"[INFO] Cut detached {len(detached)} tetras ({self.detached_policy})")
         if to_remove:
             removed = sorted(to_remove, reverse=True)
             if self.topo_proc is not None:
@@ -318,6 +766,366 @@ class RodCutController(Sofa.Core.Controller):
         else:
             if self.topo_proc is not None:
                 self.topo_proc.tetrahedraToRemove = []
+        return bool(to_remove)
+
+    def _tool_hits(self, tets):
+        # The SDF is 1-Lipschitz and the trilinear lookup is within tol of it, so a tet is
+        # surely within margin when sdf(centroid) <= margin - tol, and can only be within
+        # margin when sdf(centroid) <= margin + circumradius + tol. Undecided tets are split
+        # into eight children and retested; after refine_depth levels the tets still
+        # undecided are settled exactly against the tool triangles.
+        tol = 0.5 * math.sqrt(3.0) * self.tool.spacing
+        hit = np.zeros(len(tets), dtype=bool)
+        owner = np.arange(len(tets))
+        children = tets
+        for depth in range(self.refine_depth + 1):
+            if len(children) == 0:
+                break
+            centroid = children.mean(axis=1)
+            radius = np.linalg.norm(children - centroid[:, None, :], axis=2).max(axis=1)
+            dist = self.tool.query(centroid)
+            hit[owner[dist <= self.margin - tol]] = True
+            undecided = (dist <= self.margin + radius + tol) & ~hit[owner]
+            if depth == self.refine_depth:
+                pending = np.unique(owner[undecided])
+                if pending.size:
+                    hit[pending] = self.tool.tet_distance(tets[pending]) <= self.margin
+                break
+            children = _subdivide_tets(children[undecided])
+            owner = np.repeat(owner[undecided], 8)
+        return hit
+
+    def _anchor_mask(self, count):
+        indices = getattr(self.fixed_box, "indices", None) if self.fixed_box is not None else None
+        indices = list(getattr(indices, "value", indices) or [])
+        mask = np.zeros(count, dtype=bool)
+        anchors = [i for i in indices if i < count] + [i for i in self._frozen if i < count]
+        if not anchors:
+            return None
+        mask[anchors] = True
+        return mask
+
+    def _detached_tets(self, positions, tetras, removed):
+        # Best-first flood fill from the tets bordering the cut, steered towards the anchors.
+        # A search that reaches an anchored vertex (or an already-attached tet) stops early;
+        # one that runs out of tets has enumerated a whole detached fragment.
+        anchors = self._anchor_mask(len(positions))
+        if anchors is None:
+            return []
+        alive = np.ones(len(tetras), dtype=bool)
+        alive[removed] = False
+        alive_ids = np.nonzero(alive)[0]
+        flat = tetras[alive_ids].ravel()
+        order = np.argsort(flat, kind="stable")
+        vert_tets = np.repeat(alive_ids, 4)[order].tolist()
+        starts = np.searchsorted(flat[order], np.arange(len(positions) + 1)).tolist()
+        touched = np.zeros(len(positions), dtype=bool)
+        touched[tetras[removed].ravel()] = True
+        seeds = np.nonzero(alive & touched[tetras].any(axis=1))[0].tolist()
+        lo = positions[anchors].min(axis=0)
+        hi = positions[anchors].max(axis=0)
+        first = positions[tetras[:, 0]]
+        key = np.linalg.norm(np.maximum(np.maximum(lo - first, first - hi), 0.0), axis=1).tolist()
+        anchored = anchors.tolist()
+        tets = tetras.tolist()
+        state = [0] * len(tets)  # 0 unseen, 1 attached, 2 detached, 3 in current search
+        detached = []
+        for seed in seeds:
+            if state[seed]:
+                continue
+            state[seed] = 3
+            visited = [seed]
+            heap = [(key[seed], seed)]
+            result = 2
+            while heap and result == 2:
+                _, t = heapq.heappop(heap)
+                for v in tets[t]:
+                    if anchored[v]:
+                        result = 1
+                        break
+                    for n in vert_tets[starts[v] : starts[v + 1]]:
+                        if state[n] == 0:
+                            state[n] = 3
+                            visited.append(n)
+                            heapq.heappush(heap, (key[n], n))
+                        elif state[n] == 1:
+                            result = 1
+                            break
+                    if result == 1:
+                        break
+            for t in visited:
+                state[t] = result
+            if result == 2:
+                detached.extend(visited)
+        return detached
+
+    def _has_data(self, obj, name):
+        find = getattr(obj, "findData", None)
+        if find is None:
+            return hasattr(obj, name)
+        try:
+            return find(name) is not None
+        except Exception:
+            return False
+
+    def _maybe_compact(self):
+        if not self._can_compact:
+            if self.compact_requested:
+                self.compact_requested = False
+                print("[WARNING] Compaction skipped: pointsToRemove is not available")
+            return
+        tetras = self._get_tetras(self.topo)
+        if tetras is None:
+            return
+        count = len(tetras)
+        if not self.compact_requested and count == self._last_tet_count:
+            return
+        self._last_tet_count = count
+        positions = self._get_positions(self.dofs)
+        if positions is None or len(positions) == 0:
+            return
+        referenced = np.zeros(len(positions), dtype=bool)
+        if count:
+            referenced[np.asarray(tetras, dtype=int).ravel()] = True
+        orphans = np.nonzero(~referenced)[0]
+        ratio = len(orphans) / len(positions)
+        if not self.compact_requested and ratio < self.compact_ratio:
+            return
+        self.compact_requested = False
+        if len(orphans) == 0:
+            print("[INFO] Compaction skipped: no orphan points")
+            return
+        removed = sorted(orphans.tolist(), reverse=True)
+        rest = self._get_rest_positions(self.dofs)
+        rest = np.array(rest, dtype=float) if rest is not None and len(rest) == len(positions) else None
+        self.topo_proc.pointsToRemove = removed
+        self._pending_compaction = (len(positions), removed, rest)
+
+    def _finish_compaction(self):
+        old_count, removed, old_rest = self._pending_compaction
+        self._pending_compaction = None
+        if self.topo_proc is not None:
+            self.topo_proc.pointsToRemove = []
+        new_count = len(self._get_positions(self.dofs))
+        if new_count != old_count - len(removed):
+            print(f"[WARNING] Compaction not applied: expected {old_count - len(removed)} points, found {new_count}")
+            return
+        # Replay the modifier's swap-with-last removal to get the new -> old point order.
+        order = list(range(old_count))
+        for i in removed:
+            order[i] = order[-1]
+            order.pop()
+        # Only trust the replay if the surviving rest positions really moved that way.
+        reproject = False
+        rest = self._get_rest_positions(self.dofs)
+        if old_rest is None or rest is None or len(rest) != new_count:
+            print("[WARNING] Compaction: rest positions unavailable, point order not verified")
+        elif not np.allclose(np.asarray(rest, dtype=float), old_rest[order]):
+            print("[WARNING] Compaction: points were not renumbered by swap-with-last, matching rest positions")
+            order = self._match_rest_order(old_rest, rest)
+            reproject = True
+        if order is None:
+            print("[WARNING] Compaction: could not match points, indices were not remapped")
+            if self.uv_projector is not None:
+                self.uv_projector.reproject()
+            return
+        new_index = [-1] * old_count
+        for new, old in enumerate(order):
+            new_index[old] = new
+        if self.fixed_box is not None:
+            data = getattr(self.fixed_box, "indices", None)
+            indices = list(getattr(data, "value", data) or [])
+            remapped = sorted(new_index[i] for i in indices if i < old_count and new_index[i] >= 0)
+            if data is not None and hasattr(data, "value"):
+                data.value = remapped
+            else:
+                self.fixed_box.indices = remapped
+        frozen = {new_index[i] for i in self._frozen if i < old_count and new_index[i] >= 0}
+        self._frozen = set()
+        self._freeze_points(frozen)
+        if self.uv_projector is not None:
+            if reproject:
+                self.uv_projector.reproject()
+            else:
+                self.uv_projector.remap(order)
+        if self.quality_monitor is not None:
+            self.quality_monitor.remap_points(new_index)
+        self.last_compaction = {"before": old_count, "after": new_count, "removed": len(removed)}
+        shrink = 100.0 * len(removed) / old_count
+        print(f"[INFO] Compaction removed {len(removed)} orphan points ({old_count} -> {new_count}, -{shrink:.1f}%)")
+
+    def _get_rest_positions(self, mo):
+        rest = getattr(mo, "rest_position", None)
+        if rest is None:
+            return None
+        return getattr(rest, "value", rest)
+
+    def _match_rest_order(self, old_rest, rest):
+        lookup = {}
+        for i, p in enumerate(old_rest.tolist()):
+            key = tuple(p)
+            lookup[key] = -1 if key in lookup else i
+        order = [lookup.get(tuple(p), -1) for p in np.asarray(rest, dtype=float).tolist()]
+        if -1 in order or len(set(order)) != len(order):
+            return None
+        return order
+
+    def _freeze_points(self, points):
+        self._frozen.update(points)
+        if self.frozen_constraint is None:
+            return
+        indices = sorted(self._frozen)
+        data = getattr(self.frozen_constraint, "indices", None)
+        if data is not None and hasattr(data, "value"):
+            data.value = indices
+        else:
+            self.frozen_constraint.indices = indices
+
+
+def tet_quality(positions, tetras):
+    # Mean-ratio style shape measure: 1 for a regular tet, 0 when flat, negative when inverted.
+    p = positions[tetras]
+    e1 = p[:, 1] - p[:, 0]
+    e2 = p[:, 2] - p[:, 0]
+    e3 = p[:, 3] - p[:, 0]
+    volume = np.einsum("ij,ij->i", e1, np.cross(e2, e3)) / 6.0
+    edges = np.stack([e1, e2, e3, p[:, 2] - p[:, 1], p[:, 3] - p[:, 1], p[:, 3] - p[:, 2]], axis=1)
+    l_rms = np.sqrt(np.einsum("ijk,ijk->i", edges, edges) / 6.0)
+    return 6.0 * math.sqrt(2.0) * volume / np.maximum(l_rms, 1e-12) ** 3
+
+
+class ElementQualityMonitor(Sofa.Core.Controller):
+    def __init__(
+        self,
+        dofs,
+        linear_solver=None,
+        threshold=0.02,
+        policy="remove",
+        max_iterations=25,
+        report_interval=250,
+        history_length=250,
+        max_passes=4,
+    ):
+        super().__init__()
+        self.listening = True
+        self.dofs = dofs
+        self.linear_solver = linear_solver
+        self.threshold = threshold
+        self.policy = policy
+        self.max_iterations = max_iterations
+        self.report_interval = report_interval
+        self.max_passes = max_passes
+        # With policy="flag": every degenerate tet flagged so far and still in the mesh, stored as a
+        # sorted vertex 4-tuple because SOFA renumbers tets (swap with last) whenever some are removed.
+        self.flagged = set()
+        self.frame = {"checked": 0, "degenerate": 0, "reflagged": 0, "min_quality": None}
+        self.history = deque(maxlen=history_length)
+        self._frames = 0
+
+    def check(self, positions, tetras, removed):
+        # Only the surviving tets sharing a vertex with the cut are re-evaluated. With
+        # policy="remove", the ring around each batch of removed degenerate tets is checked
+        # too (up to max_passes rings), since their removal exposes a new boundary.
+        self.discard(tetras, removed)
+        rest = getattr(self.dofs, "rest_position", None)
+        rest = getattr(rest, "value", rest)
+        if rest is not None and len(rest) == len(positions):
+            rest = np.asarray(rest, dtype=float)
+        else:
+            rest = None
+        dead = np.zeros(len(tetras), dtype=bool)
+        dead[removed] = True
+        seen = dead.copy()
+        frontier = removed
+        found = []
+        checked = 0
+        for _ in range(self.max_passes):
+            touched = np.zeros(len(positions), dtype=bool)
+            touched[tetras[frontier].ravel()] = True
+            neighbours = np.nonzero(~seen & touched[tetras].any(axis=1))[0]
+            if neighbours.size == 0:
+                break
+            seen[neighbours] = True
+            checked += int(neighbours.size)
+            quality = tet_quality(positions, tetras[neighbours])
+            if rest is not None:
+                quality *= np.sign(tet_quality(rest, tetras[neighbours]))
+            else:
+                quality = np.abs(quality)
+            low = float(quality.min())
+            if self.frame["min_quality"] is None or low < self.frame["min_quality"]:
+                self.frame["min_quality"] = low
+            degenerate = neighbours[quality < self.threshold].tolist()
+            found.extend(degenerate)
+            if self.policy != "remove" or not degenerate:
+                break
+            dead[degenerate] = True
+            frontier = degenerate
+        # "degenerate" counts each bad tet once; under policy="flag" a tet already flagged by an
+        # earlier cut is counted in "reflagged" instead.
+        new = len(found)
+        if self.policy == "flag":
+            keys = self._keys(tetras, found)
+            new = len(keys - self.flagged)
+            self.flagged.update(keys)
+        self.frame["checked"] += checked
+        self.frame["degenerate"] += new
+        self.frame["reflagged"] += len(found) - new
+        if new:
+            print(f"[INFO] Quality: {new}/{checked} cut-adjacent tetras below {self.threshold} ({self.policy})")
+        return found
+
+    @staticmethod
+    def _keys(tetras, indices):
+        return {tuple(t) for t in np.sort(tetras[indices], axis=1).tolist()}
+
+    def discard(self, tetras, indices):
+        if self.flagged and len(indices):
+            self.flagged.difference_update(self._keys(tetras, indices))
+
+    def remap_points(self, new_index):
+        # Flagged tets are alive, so none of their vertices is dropped by a compaction.
+        self.flagged = {tuple(sorted(new_index[v] for v in key)) for key in self.flagged}
+
+    def _cg_iterations(self):
+        solver = self.linear_solver
+        if solver is None:
+            return None
+        for name in ("currentIterations", "current_iterations"):
+            data = getattr(solver, name, None)
+            if data is not None:
+                value = getattr(data, "value", data)
+                if isinstance(value, (int, float)):
+                    return int(value)
+        graph = getattr(solver, "graph", None)
+        graph = getattr(graph, "value", graph)
+        if isinstance(graph, dict):
+            for key, values in graph.items():
+                if str(key).endswith("Error"):
+                    # The residual series starts with a seed value of 1 before the first iteration.
+                    return max(0, len(values) - 1)
+        return None
+
+    def onAnimateEndEvent(self, _event):
+        self.frame["cg_iterations"] = self._cg_iterations()
+        self.frame["flagged"] = len(self.flagged)
+        self.history.append(self.frame)
+        self.frame = {"checked": 0, "degenerate": 0, "reflagged": 0, "min_quality": None}
+        self._frames += 1
+        if self.report_interval and self._frames % self.report_interval == 0:
+            print(f"[INFO] {self.summary()}")
+
+    def summary(self):
+        iterations = [f["cg_iterations"] for f in self.history if f["cg_iterations"] is not None]
+        degenerate = sum(f["degenerate"] for f in self.history)
+        checked = sum(f["checked"] for f in self.history)
+        text = f"Last {len(self.history)} frames: {degenerate}/{checked} degenerate tetras"
+        if iterations:
+            mean = sum(iterations) / len(iterations)
+            capped = sum(1 for i in iterations if i >= self.max_iterations)
+            text += f", CG iterations mean {mean:.1f} max {max(iterations)}"
+            text += f", {capped} frames at cap {self.max_iterations}"
+        return text
 
 
 class SurfaceUVProjector(Sofa.Core.Controller):
@@ -329,6 +1137,7 @@ class SurfaceUVProjector(Sofa.Core.Controller):
         self.axis_u = axis_u
         self.axis_v = axis_v
         self._last_size = None
+        self._texcoords = None
 
     def onAnimateBeginEvent(self, _event):
         positions = self._get_positions(self.source_dofs)
@@ -351,6 +1160,17 @@ class SurfaceUVProjector(Sofa.Core.Controller):
             return []
         return getattr(pos, "value", pos)
 
+    def reproject(self):
+        self._last_size = None
+
+    def remap(self, order):
+        # Keep each surviving point's UV after a point compaction instead of re-projecting.
+        if self._texcoords is None or any(i >= len(self._texcoords) for i in order):
+            self._last_size = None
+            return
+        self._set_texcoords([self._texcoords[i] for i in order])
+        self._last_size = len(order)
+
     def _apply_uvs(self, positions):
         mins = [min(p[i] for p in positions) for i in range(3)]
         maxs = [max(p[i] for p in positions) for i in range(3)]
@@ -364,6 +1184,10 @@ class SurfaceUVProjector(Sofa.Core.Controller):
             [(p[self.axis_u] - mins[self.axis_u]) / du, (p[self.axis_v] - mins[self.axis_v]) / dv]
             for p in positions
         ]
+        self._set_texcoords(texcoords)
+
+    def _set_texcoords(self, texcoords):
+        self._texcoords = texcoords
         data = getattr(self.target_visual, "texcoords", None)
         if data is None:
             return
@@ -440,35 +1264,24 @@ def createScene(root):
     mouse.addObject("FixPickedParticleButtonSetting", button="Right", stiffness=10000)
 
     # Rod tool (keyboard-controlled cutter)
+    # Tool shape: "rod", "scalpel" or "hook"; its SDF grid is cached next to the scene.
+    scene_dir = os.path.dirname(os.path.abspath(__file__))
+    tool_shape = "rod"
+    tool_margin = 0.0
     rod = root.addChild("RodTool")
     rod_center = [-5.0, 2.0, 0.0]
     rod_half = [0.12, 0.12, 2.5]
-    hx, hy, hz = rod_half
+    tool_vertices, rod_triangles = build_tool_mesh(tool_shape, rod_half)
+    tool = ToolSDF(
+        tool_vertices,
+        rod_triangles,
+        feature_cells=2,
+        padding=0.5,
+        cache_dir=os.path.join(scene_dir, ".tool_cache"),
+        name=tool_shape,
+    )
     cx, cy, cz = rod_center
-    rod_positions = [
-        [cx - hx, cy - hy, cz - hz],
-        [cx + hx, cy - hy, cz - hz],
-        [cx + hx, cy + hy, cz - hz],
-        [cx - hx, cy + hy, cz - hz],
-        [cx - hx, cy - hy, cz + hz],
-        [cx + hx, cy - hy, cz + hz],
-        [cx + hx, cy + hy, cz + hz],
-        [cx - hx, cy + hy, cz + hz],
-    ]
-    rod_triangles = [
-        [0, 1, 2],
-        [0, 2, 3],
-        [4, 5, 6],
-        [4, 6, 7],
-        [0, 1, 5],
-        [0, 5, 4],
-        [1, 2, 6],
-        [1, 6, 5],
-        [2, 3, 7],
-        [2, 7, 6],
-        [3, 0, 4],
-        [3, 4, 7],
-    ]
+    rod_positions = [[x + cx, y + cy, z + cz] for x, y, z in tool_vertices]
     rod.addObject("TriangleSetTopologyContainer", name="topo", triangles=rod_triangles)
     rod.addObject("TriangleSetGeometryAlgorithms")
     rod_mo = rod.addObject("MechanicalObject", name="dofs", position=rod_positions)
@@ -485,12 +1298,12 @@ def createScene(root):
     rod_is_rigid = False
 
     # Liver volume
-    scene_dir = os.path.dirname(os.path.abspath(__file__))
     msh_path = os.path.join(scene_dir, "liver3-HD.msh")
     tex_path = os.path.join(scene_dir, "liver2.png")
     liver = root.addChild("Liver")
     liver.addObject("EulerImplicitSolver", rayleighStiffness=0.1, rayleighMass=0.1)
-    liver.addObject("CGLinearSolver", iterations=25, tolerance=1e-9, threshold=1e-9)
+    cg_iterations = 25
+    cg = liver.addObject("CGLinearSolver", iterations=cg_iterations, tolerance=1e-9, threshold=1e-9)
     loader = liver.addObject("MeshGmshLoader", name="meshLoader", filename=msh_path)
     dofs = liver.addObject("MechanicalObject", name="dofs", src="@meshLoader")
     topo = liver.addObject("TetrahedronSetTopologyContainer", name="topo", src="@meshLoader", listening=True)
@@ -513,13 +1326,18 @@ def createScene(root):
         computeGlobalMatrix=False,
     )
 
-    liver.addObject(
+    fixed_box = liver.addObject(
         "BoxROI",
         name="fixedBox",
         box=[-11.0, -3.0, 5.5, 7.0, 7.0, 6.9],
         drawBoxes=False,
     )
     liver.addObject("FixedConstraint", indices="@fixedBox.indices")
+    # Tissue cut loose from fixedBox: "remove" it with the cut, "freeze" it in place, or None to keep simulating it
+    detached_policy = "remove"
+    frozen_constraint = None
+    if detached_policy == "freeze":
+        frozen_constraint = liver.addObject("FixedConstraint", name="frozenConstraint", indices=[])
 
     # Surface generated from volume (guaranteed to follow deformation)
     surface = liver.addChild("Surface")
@@ -549,6 +1367,9 @@ def createScene(root):
     )
     visu.addObject("IdentityMapping", input="@../surfDofs", output="@Visual")
 
+    uv_projector = SurfaceUVProjector(surf_dofs, visual, axis_u=0, axis_v=2)
+    # Cut-adjacent tets below the quality threshold: "remove" them with the cut or just "flag" them
+    quality_monitor = ElementQualityMonitor(dofs, cg, threshold=0.02, policy="remove", max_iterations=cg_iterations)
     root.addObject(
         RodCutController(
             rod_mo,
@@ -557,12 +1378,20 @@ def createScene(root):
             topo_mod,
             topo_proc,
             rod_center,
-            rod_half,
+            tool,
             speed=8.0,
             dt=root.dt.value,
             rigid=rod_is_rigid,
+            margin=tool_margin,
+            fixed_box=fixed_box,
+            detached_policy=detached_policy,
+            frozen_constraint=frozen_constraint,
+            uv_projector=uv_projector,
+            compact_ratio=0.2,
+            quality_monitor=quality_monitor,
         )
     )
-    root.addObject(SurfaceUVProjector(surf_dofs, visual, axis_u=0, axis_v=2))
+    root.addObject(uv_projector)
+    root.addObject(quality_monitor)
 
     return root